@@ -1,3 +1,3 @@
-from .ip_list import IPList
+from .ip_list import IPList, clear_read_cache, set_read_cache_size
 
-__all__ = ["IPList"]
+__all__ = ["IPList", "clear_read_cache", "set_read_cache_size"]
@@ -1,15 +1,263 @@
-import ipaddress
+import locale
 import logging
+import re
+import socket
 import tempfile
+import threading
+import zlib
+from collections import OrderedDict
 from contextlib import contextmanager
+from functools import lru_cache
+from ipaddress import IPv4Address
 from pathlib import Path
 from shlex import quote
-from typing import List, Optional, Set, Union
+from typing import (
+    IO,
+    AbstractSet,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+# Longest possible dotted-quad, "255.255.255.255"
+_MAX_IPV4_LEN = 15
+
+
+class _FileSnapshot(NamedTuple):
+    """
+    A parsed file, as held by the shared read cache.
+
+    The address set is shared by every reader of the file and must never be
+    mutated; instances copy it into their own ips.
+    """
+
+    size: int
+    crc32: int
+    ips: AbstractSet[str]
+
+
+# Parsed file contents shared by all instances, keyed by
+# (resolved path, ignore_invalid, unchecked), least recently used first. An
+# entry is only a starting point: read() always compares it with the file's
+# current bytes before reusing it. Kept small since each entry pins a full
+# set of addresses; see set_read_cache_size() and clear_read_cache().
+_ReadCacheKey = Tuple[Path, bool, bool]
+_READ_CACHE: "OrderedDict[_ReadCacheKey, _FileSnapshot]" = OrderedDict()
+_READ_CACHE_SIZE = 16
+_READ_CACHE_LOCK = threading.Lock()
+
+
+# A '#' comment up to the end of its line
+_COMMENT_RE = re.compile(r"#[^\r\n]*")
+
+# Inputs with more cleaned lines than this bypass the _is_ipv4 cache: unique
+# addresses would only thrash it, and a miss costs more than an uncached call.
+_IPV4_CACHE_SIZE = 4096
+
+
+def _is_ipv4(s: str) -> bool:
+    """
+    Checks whether a string is a dotted-quad IPv4 address.
+
+    Uses ``socket.inet_pton`` rather than :mod:`ipaddress` so validation is a
+    single C call. ``inet_pton`` is used over ``inet_aton`` because the latter
+    also accepts shorthand, octal and hex forms (e.g. ``1.2.3``, ``0x1.2.3.4``)
+    that ``ipaddress`` rejects.
+
+    Strings longer than ``_MAX_IPV4_LEN`` or containing ``':'`` are rejected
+    without parsing. See ``_is_ipv4_cached`` for the memoized variant.
+
+    Args:
+        s (str): The candidate address, already stripped of whitespace/comments.
+
+    Returns:
+        bool: True if *s* is a valid IPv4 address, False otherwise.
+    """
+    # Cheap rejects before the parser: too long, or an IPv6 candidate
+    if len(s) > _MAX_IPV4_LEN or ":" in s:
+        return False
+    try:
+        socket.inet_pton(socket.AF_INET, s)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+# Memoized _is_ipv4, so duplicate lines and repeated IPList.reload() calls on
+# small overlapping files cost a dict lookup per address.
+_is_ipv4_cached = lru_cache(maxsize=_IPV4_CACHE_SIZE)(_is_ipv4)
+
+
+@lru_cache(maxsize=512)
+def _is_ipv6(s: str) -> bool:
+    """
+    Checks whether a string is an IPv6 address.
+
+    Args:
+        s (str): The candidate address, already stripped of whitespace/comments.
+
+    Returns:
+        bool: True if *s* is a valid IPv6 address, False otherwise.
+    """
+    try:
+        socket.inet_pton(socket.AF_INET6, s)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def _clean_lines(lines: Iterable[str]) -> List[str]:
+    """
+    Strips comments and whitespace from raw lines.
+
+    Each line is cut at the first '#' (full-line and inline comments) and
+    stripped of whitespace; lines that end up empty are dropped.
+
+    Args:
+        lines (Iterable[str]): Raw lines, e.g. a caller-supplied list.
+
+    Returns:
+        List[str]: The non-empty cleaned lines, in input order.
+    """
+    return [line for line in (raw.partition("#")[0].strip() for raw in lines) if line]
+
+
+def _clean_text(text: str) -> List[str]:
+    """
+    Splits text into lines and cleans them like :func:`_clean_lines`.
+
+    Comments are removed from the whole text in one regex pass before
+    splitting, so the per-line work is a C-level ``map(str.strip, ...)``.
+    Lines are split only on ``\\n``, ``\\r\\n`` and ``\\r`` like a file opened in
+    text mode; unlike ``str.splitlines()``, characters such as ``\\x0c`` or
+    ``\\u2028`` do not end a line.
+
+    Args:
+        text (str): The full contents of an IP list file.
+
+    Returns:
+        List[str]: The non-empty cleaned lines, in file order.
+    """
+    if "#" in text:
+        text = _COMMENT_RE.sub("", text)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return list(filter(None, map(str.strip, text.split("\n"))))
+
+
+def _address_key(ip: object) -> Optional[str]:
+    """
+    Converts a membership query to the dotted-quad form stored in ips.
+
+    Args:
+        ip (object): A str, an ``IPv4Address`` or an int in ``0 .. 2**32 - 1``.
+
+    Returns:
+        str | None: The string to look up, or None for any other value (which
+            is never in a list).
+    """
+    if isinstance(ip, str):
+        return ip
+    if isinstance(ip, IPv4Address):
+        return str(ip)
+    # bool is an int subclass but never means an address
+    if isinstance(ip, int) and not isinstance(ip, bool) and 0 <= ip <= 0xFFFFFFFF:
+        return socket.inet_ntoa(ip.to_bytes(4, "big"))
+    return None
+
+
+def _lookup_keys(queries: Iterable[object]) -> Iterable[object]:
+    """
+    Prepares bulk membership queries for lookups against ips.
+
+    A list of plain strings, the common case, is returned as-is so the
+    lookups stay in C. Anything else goes through :func:`_address_key`, so
+    every query matches exactly as it would with ``in``.
+
+    Args:
+        queries (Iterable[object]): The values to look up.
+
+    Returns:
+        Iterable[object]: Keys to test against ips, one per query.
+    """
+    if not isinstance(queries, list):
+        queries = list(queries)
+    if set(map(type, queries)) <= {str}:
+        return queries
+    return map(_address_key, queries)
+
+
+def _read_cache_get(key: _ReadCacheKey) -> Optional[_FileSnapshot]:
+    """
+    Looks up the last parse of a file in the shared read cache.
+
+    Args:
+        key (_ReadCacheKey): The file's path and parse settings.
+
+    Returns:
+        _FileSnapshot | None: The cached snapshot, or None on a miss.
+    """
+    with _READ_CACHE_LOCK:
+        snapshot = _READ_CACHE.get(key)
+        if snapshot is not None:
+            _READ_CACHE.move_to_end(key)
+        return snapshot
+
+
+def _read_cache_put(key: _ReadCacheKey, snapshot: _FileSnapshot):
+    """
+    Stores a parsed file in the shared read cache, replacing any earlier parse
+    of the same path and evicting the least recently used entry when full.
+
+    Args:
+        key (_ReadCacheKey): The file's path and parse settings.
+        snapshot (_FileSnapshot): The parsed file.
+    """
+    with _READ_CACHE_LOCK:
+        _READ_CACHE[key] = snapshot
+        _READ_CACHE.move_to_end(key)
+        while len(_READ_CACHE) > _READ_CACHE_SIZE:
+            _READ_CACHE.popitem(last=False)
+
+
+def clear_read_cache():
+    """
+    Drops every parsed file held by the shared read cache.
+
+    Instances keep their own ips; only the next read() of each file has to
+    parse it again.
+    """
+    with _READ_CACHE_LOCK:
+        _READ_CACHE.clear()
+
+
+def set_read_cache_size(size: int):
+    """
+    Sets how many parsed files the shared read cache keeps.
+
+    Args:
+        size (int): The maximum number of files. 0 disables the cache.
+
+    Raises:
+        ValueError: If size is negative.
+    """
+    global _READ_CACHE_SIZE
+    if size < 0:
+        raise ValueError(f"Read cache size must not be negative: {size}")
+    with _READ_CACHE_LOCK:
+        _READ_CACHE_SIZE = size
+        while len(_READ_CACHE) > size:
+            _READ_CACHE.popitem(last=False)
+
 
 class IPList:
     """
@@ -20,15 +268,19 @@ class IPList:
             aliases: file, path
             coercion: quoted_abs[olute]
         ignore_invalid (bool): Whether to ignore invalid IP addresses.
+        unchecked (bool): Whether entries are stored without validation.
         ips (Set[str]): A set of valid IP addresses.
             aliases: values, set
             coercions: list
 
     Methods:
+        from_bytes(): Creates an IPList from file contents held in memory.
         read(): Reads and validates IP addresses from the file.
         reload(): Re-reads the IPs from the file, overwriting the existing '.ips' attribute.
         write_to_tempfile(): Writes the IP list to a temporary file and returns the path object.
         to_tempfile(): Context manager for temporary file creation.
+        contains_many(): Checks membership for many IP addresses at once.
+        contains_all(), contains_any(): Bulk all/any membership checks.
 
     Supported dunders: __contains__, __eq__, __len__, __reduce__, __repr__, __str__
 
@@ -39,6 +291,7 @@ class IPList:
         file_path: Optional[Union[str, Path]] = None,
         ignore_invalid: bool = False,
         ips: Optional[List[str]] = None,
+        unchecked: bool = False,
     ):
         """
         Initializes the IPList object.
@@ -47,6 +300,9 @@ class IPList:
             file_path (str | Path | None): The path to the file containing IP addresses.
             ignore_invalid (bool): If True, invalid IPs are ignored. If False, a ValueError is raised.
             ips (List[str] | None): A list of IP addresses to initialize with (instead of a file).
+            unchecked (bool): If True, entries are only stripped of whitespace and comments,
+                not validated. Only use this for trusted, pre-validated input, such as a
+                file written by write_to_tempfile().
 
         Raises:
             ValueError: If neither file_path nor ips is provided, or if both are provided.
@@ -56,97 +312,224 @@ class IPList:
         if file_path is not None and ips is not None:
             raise ValueError("Cannot provide both file_path and ips")
 
-        self.file_path = Path(file_path) if file_path is not None else None
-        self.ignore_invalid = ignore_invalid
-        self.ips: Set[str] = set()
-
+        self._init_attributes(
+            Path(file_path) if file_path is not None else None,
+            ignore_invalid,
+            unchecked,
+            source="file" if ips is None else "list",
+        )
         if ips is not None:
             self._load_from_list(ips)
         else:
             self.read()
 
-    def _load_from_list(self, ips: List[str]):
+    def _init_attributes(
+        self,
+        file_path: Optional[Path],
+        ignore_invalid: bool,
+        unchecked: bool,
+        source: str,
+    ):
         """
-        Loads and validates IP addresses from a list.
+        Sets up every instance attribute except the loaded ips.
+
+        Shared by __init__() and from_bytes(), so instances built either way
+        have the same attributes.
 
         Args:
-            ips (List[str]): A list of IP address strings.
+            file_path (Path | None): The path to the file containing IP addresses.
+            ignore_invalid (bool): Whether to ignore invalid IP addresses.
+            unchecked (bool): Whether entries are stored without validation.
+            source (str): Where the IPs come from, for repr()/str() when there
+                is no file_path: "file", "list" or "bytes".
         """
-        logging.debug("Loading IP list from provided list")
-        self.ips.clear()
-        for line in ips:
-            # Normalize whitespace
-            line = line.strip()
-            if not line:
-                # Skip empty lines
-                continue
+        self.file_path = file_path
+        self.ignore_invalid = ignore_invalid
+        self.unchecked = unchecked
+        self._source = source
+        # Assigned by the caller's loader; no placeholder set is built
+        self.ips: Set[str]
+        # Snapshot of ips and its sorted form, reused while ips is unchanged.
+        # Only kept from the second sort on, so a one-off write holds nothing.
+        self._sorted_cache: Optional[Tuple[FrozenSet[str], List[str]]] = None
+        self._sorted_before = False
+
+    def _parse(self, cleaned: List[str]) -> Set[str]:
+        """
+        Validates cleaned lines into a set of IPv4 addresses.
 
-            # Handle inline comments in the same way as file-based loading:
-            # take only the part before the first '#' and strip it again.
-            if "#" in line:
-                line = line.split("#", 1)[0].strip()
-                if not line:
-                    # Line contained only a comment after stripping
-                    continue
-            try:
-                ip = ipaddress.ip_address(line)
-            except ValueError:
-                if self.ignore_invalid:
-                    logging.debug(f"Ignoring invalid IP address: {line}")
-                    continue
-                else:
-                    raise ValueError(f"Invalid IP address found: {line}")
+        With unchecked set, the lines are kept as-is without validation.
+
+        Args:
+            cleaned (List[str]): Lines from :func:`_clean_lines` or :func:`_clean_text`.
+
+        Returns:
+            Set[str]: The valid IPv4 addresses found in *cleaned*.
 
-            if ip.version == 4:
-                self.ips.add(line)
-            elif ip.version == 6:
+        Raises:
+            ValueError: If an invalid or IPv6 address is found and neither
+                ignore_invalid nor unchecked is set.
+        """
+        if self.unchecked:
+            return set(cleaned)
+        # filter() drives the validation loop from C; the per-line reporting
+        # pass only runs when something was rejected and there is something
+        # to report: an error to raise, or debug logging to emit.
+        is_ipv4 = _is_ipv4_cached if len(cleaned) <= _IPV4_CACHE_SIZE else _is_ipv4
+        valid = list(filter(is_ipv4, cleaned))
+        if len(valid) != len(cleaned) and (
+            not self.ignore_invalid or logging.getLogger().isEnabledFor(logging.DEBUG)
+        ):
+            self._report_rejected(cleaned)
+        return set(valid)
+
+    def _report_rejected(self, lines: Iterable[str]):
+        """
+        Logs or raises for each line that is not a valid IPv4 address.
+
+        Args:
+            lines (Iterable[str]): Cleaned, non-empty lines.
+
+        Raises:
+            ValueError: On the first invalid or IPv6 address if ignore_invalid is False.
+        """
+        for line in lines:
+            if _is_ipv4(line):
+                continue
+
+            # Only strings containing ':' can be IPv6, so the IPv6 parser is
+            # skipped entirely for other rejects.
+            if ":" in line and _is_ipv6(line):
                 if self.ignore_invalid:
-                    logging.debug(f"Ignoring IPv6 address: {line}")
+                    logging.debug("Ignoring IPv6 address: %s", line)
                 else:
                     raise ValueError(f"IPv6 address found and not ignored: {line}")
+            elif self.ignore_invalid:
+                logging.debug("Ignoring invalid IP address: %s", line)
+            else:
+                raise ValueError(f"Invalid IP address found: {line}")
+
+    def _load_from_list(self, ips: List[str]):
+        """
+        Loads and validates IP addresses from a list.
+
+        Args:
+            ips (List[str]): A list of IP address strings.
+        """
+        logging.debug("Loading IP list from provided list")
+        self.ips = self._parse(_clean_lines(ips))
+        self._sorted_cache = None
+        self._sorted_before = False
         logging.info(f"Loaded {len(self.ips)} IPs from list")
 
+    @classmethod
+    def from_bytes(
+        cls,
+        buf: bytes,
+        ignore_invalid: bool = False,
+        unchecked: bool = False,
+        encoding: Optional[str] = None,
+    ) -> "IPList":
+        """
+        Creates an IPList from the contents of an IP list file held in memory.
+
+        The buffer is decoded, cleaned and validated exactly like a file passed
+        to read(), without writing it to disk first. __init__() is not called;
+        subclasses that add attributes should set them in _init_attributes().
+
+        Args:
+            buf (bytes): The file contents; any bytes-like object is accepted.
+            ignore_invalid (bool): If True, invalid IPs are ignored. If False, a ValueError is raised.
+            unchecked (bool): If True, entries are stored without validation.
+            encoding (str | None): The encoding used to decode *buf*. Defaults to
+                the locale's preferred encoding, as used by read().
+
+        Returns:
+            IPList: A new IPList without a file_path.
+
+        Raises:
+            ValueError: If an invalid or IPv6 address is found and neither
+                ignore_invalid nor unchecked is set.
+        """
+        if encoding is None:
+            encoding = locale.getpreferredencoding(False)
+        # Skip __init__, which requires a file_path or ips to load from
+        ip_list = cls.__new__(cls)
+        ip_list._init_attributes(None, ignore_invalid, unchecked, source="bytes")
+        ip_list.ips = ip_list._parse(_clean_text(str(buf, encoding)))
+        logging.info(f"Loaded {len(ip_list.ips)} IPs from bytes")
+        return ip_list
+
     def read(self):
         """
         Reads and validates IP addresses from the file.
 
+        The file is always read, but its bytes are first compared (by size
+        and CRC-32) with the last parse of the same path and settings, by any
+        instance. An unchanged file is not re-parsed, and a file that was only
+        appended to has just its new lines parsed; see :meth:`_read_snapshot`.
+        Instances do not keep the parse themselves: the last parse of each
+        file is held once, in a small shared cache, and stays there after its
+        instances are gone; see :func:`clear_read_cache` and
+        :func:`set_read_cache_size`. With the cache disabled, every read()
+        parses the whole file.
+
         Raises:
             ValueError: If no file_path is set.
         """
         if self.file_path is None:
             raise ValueError("Cannot read from file: no file_path set")
         logging.debug(f"Reading IP list from {self.file_path}")
-        ips_from_file = set()
-        with open(self.file_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if "#" in line:
-                    line = line.split("#", 1)[0].strip()
-                if not line:
-                    continue
-                try:
-                    ip = ipaddress.ip_address(line)
-                except ValueError:
-                    if self.ignore_invalid:
-                        logging.debug(f"Ignoring invalid IP address: {line}")
-                        continue
-                    else:
-                        raise ValueError(f"Invalid IP address found: {line}")
-
-                if ip.version == 4:
-                    ips_from_file.add(line)
-                elif ip.version == 6:
-                    if self.ignore_invalid:
-                        logging.debug(f"Ignoring IPv6 address: {line}")
-                    else:
-                        raise ValueError(f"IPv6 address found and not ignored: {line}")
-
-        self.ips = ips_from_file
+        key = (self.file_path.resolve(), self.ignore_invalid, self.unchecked)
+        snapshot = self._read_snapshot(_read_cache_get(key))
+        _read_cache_put(key, snapshot)
+        self.ips = set(snapshot.ips)
+        self._sorted_cache = None
+        self._sorted_before = False
         logging.info(f"Loaded IP list from: {self.file_path}")
 
+    def _read_snapshot(self, prev: Optional[_FileSnapshot]) -> _FileSnapshot:
+        """
+        Reads and parses the file, reusing a previous parse where possible.
+
+        The file's bytes are compared with *prev* by size and CRC-32. If they
+        are unchanged, nothing is re-parsed. If the old contents are an intact
+        prefix ending in a newline (the file was only appended to), only the
+        new tail is parsed.
+
+        Args:
+            prev (_FileSnapshot | None): An earlier parse of this file, if any.
+
+        Returns:
+            _FileSnapshot: The file's size, CRC-32 and addresses.
+
+        Raises:
+            ValueError: If an invalid or IPv6 address is found and neither
+                ignore_invalid nor unchecked is set.
+        """
+        # Read the whole file in one call and clean it in C rather than going
+        # through the io layer line by line. Decode like Path.read_text().
+        data = self.file_path.read_bytes()
+        encoding = locale.getpreferredencoding(False)
+
+        if prev is not None and len(data) >= prev.size:
+            if zlib.crc32(memoryview(data)[: prev.size]) == prev.crc32:
+                if len(data) == prev.size:
+                    logging.debug("File content unchanged, reusing parsed IPs")
+                    return prev
+                if prev.size == 0 or data[prev.size - 1] == ord("\n"):
+                    tail = data[prev.size :]
+                    logging.debug(f"File appended to, parsing {len(tail)} new bytes")
+                    new_ips = self._parse(_clean_text(tail.decode(encoding)))
+                    crc = zlib.crc32(tail, prev.crc32)
+                    return _FileSnapshot(len(data), crc, prev.ips | new_ips)
+
+        ips = self._parse(_clean_text(data.decode(encoding)))
+        return _FileSnapshot(len(data), zlib.crc32(data), ips)
+
     def reload(self):
         """
-        Re-reads the IPs from the file.
+        Re-reads the IPs from the file, discarding changes made to ips since.
 
         Raises:
             ValueError: If no file_path is set.
@@ -156,6 +539,43 @@ class IPList:
         logging.debug("Reloading IP list.")
         self.read()
 
+    def _sorted_ips(self) -> List[str]:
+        """
+        Returns the IPs in sorted order, reusing the last sort if unchanged.
+
+        Since :attr:`ips` may be mutated directly through its aliases, the
+        cache is validated by comparing against a snapshot of the set it was
+        built from, which is O(n) rather than the O(n log n) of a re-sort.
+        The snapshot and sorted list are only kept once the IPs have been
+        sorted before since the last load, so an instance that is written
+        out once does not hold a second copy of its addresses.
+
+        Returns:
+            List[str]: The sorted IPs. Callers must not mutate it.
+        """
+        cache = self._sorted_cache
+        if cache is not None and cache[0] == self.ips:
+            return cache[1]
+        ips_sorted = sorted(self.ips)
+        if self._sorted_before:
+            self._sorted_cache = (frozenset(self.ips), ips_sorted)
+        self._sorted_before = True
+        return ips_sorted
+
+    def _write_ips(self, f: IO[str]):
+        """
+        Writes the sorted IPs to an open text file, one per line.
+
+        Args:
+            f (IO[str]): The file to write to.
+        """
+        # One write for the whole list instead of one per IP. The trailing
+        # newline is written separately rather than concatenated, which would
+        # copy the whole joined buffer once more.
+        if self.ips:
+            f.write("\n".join(self._sorted_ips()))
+            f.write("\n")
+
     def write_to_tempfile(self) -> Path:
         """
         Writes the IP list to a temporary file.
@@ -166,12 +586,15 @@ class IPList:
         Note:
             The caller is responsible for deleting the temporary file.
         """
-        temp_fd, temp_path = tempfile.mkstemp(suffix=".txt", prefix="iplist_")
-        temp_file = Path(temp_path)
+        # NamedTemporaryFile closes the descriptor itself if wrapping it in a
+        # file object fails, which a bare mkstemp() + open(fd) does not.
+        tf = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".txt", prefix="iplist_", delete=False
+        )
+        temp_file = Path(tf.name)
         try:
-            with open(temp_fd, "w") as f:
-                for ip in sorted(self.ips):
-                    f.write(f"{ip}\n")
+            with tf:
+                self._write_ips(tf)
             logging.debug(f"Wrote IP list to temporary file: {temp_file}")
             return temp_file
         except Exception:
@@ -211,11 +634,15 @@ class IPList:
             other: The object to compare with.
 
         Returns:
-            bool: True if the IP lists are equal, False otherwise.
+            bool: True if the IP lists are equal, False otherwise. NotImplemented
+                if *other* is not an IPList.
         """
-        if isinstance(other, IPList):
-            return self.ips == other.ips
-        return False
+        if not isinstance(other, IPList):
+            return NotImplemented
+        # ips can be mutated after a read, so only the size is a safe shortcut
+        if len(self.ips) != len(other.ips):
+            return False
+        return self.ips == other.ips
 
     def __contains__(self, ip: object) -> bool:
         """Check whether a value is contained in this list.
@@ -225,34 +652,86 @@ class IPList:
         ``unittest.TestCase.assertIn``.
 
         Args:
-            ip (object): Value to test for membership. Only strings are
-                considered valid IP candidates; any non-string value
-                will return ``False``.
+            ip (object): Value to test for membership. Strings are looked
+                up directly; ``ipaddress.IPv4Address`` objects and integers
+                in ``0 .. 2**32 - 1`` are converted to their dotted-quad
+                form first. Any other value will return ``False``.
 
         Returns:
-            bool: ``True`` if *ip* is a string and is present in the
-            underlying IP set, otherwise ``False``.
+            bool: ``True`` if *ip* (or its dotted-quad form) is present in
+            the underlying IP set, otherwise ``False``.
         """
-        if not isinstance(ip, str):
-            return False
-        return ip in self.ips
+        return _address_key(ip) in self.ips
+
+    def contains_many(self, queries: Iterable[object]) -> List[bool]:
+        """
+        Checks membership for many IP addresses at once.
+
+        Equivalent to ``[ip in ip_list for ip in queries]``, including the
+        conversion of non-string queries, but a list of plain strings is
+        looked up entirely in C against the underlying set, so it is the
+        preferred API for high-volume membership checks.
+
+        Args:
+            queries (Iterable[object]): Values to look up, as for ``in``.
+
+        Returns:
+            List[bool]: One entry per query, True if it is in the list.
+
+        Example:
+            ip_list.contains_many(["10.0.0.1", "8.8.8.8"])  # [True, False]
+        """
+        return list(map(self.ips.__contains__, _lookup_keys(queries)))
+
+    def contains_all(self, queries: Iterable[object]) -> bool:
+        """
+        Checks whether every given IP address is in the list.
+
+        Runs in C via :meth:`set.issuperset` and stops at the first miss.
+        Queries are matched like :meth:`contains_many`.
+
+        Args:
+            queries (Iterable[object]): Values to look up, as for ``in``.
+
+        Returns:
+            bool: True if all queries are present (or *queries* is empty).
+        """
+        return self.ips.issuperset(_lookup_keys(queries))
+
+    def contains_any(self, queries: Iterable[object]) -> bool:
+        """
+        Checks whether at least one given IP address is in the list.
+
+        Runs in C via :meth:`set.isdisjoint` and stops at the first hit.
+        Queries are matched like :meth:`contains_many`.
+
+        Args:
+            queries (Iterable[object]): Values to look up, as for ``in``.
+
+        Returns:
+            bool: True if any query is present, False otherwise.
+        """
+        return not self.ips.isdisjoint(_lookup_keys(queries))
 
     def __repr__(self):
         file_info = (
-            f"file_path={self.file_path}" if self.file_path else "from_list=True"
+            f"file_path={self.file_path}"
+            if self.file_path
+            else f"from_{self._source}=True"
         )
         return f"IPList({file_info}, ignore_invalid={self.ignore_invalid}, ip_count={len(self.ips)})"
 
     def __str__(self):
-        source = str(self.file_path) if self.file_path else "list"
+        source = str(self.file_path) if self.file_path else self._source
         return f"IPList with {len(self.ips)} IPs from {source}"
 
     def __reduce__(self):
         # For pickling: convert ip_list back to list for ips parameter
         if self.file_path is not None:
-            return (self.__class__, (self.file_path, self.ignore_invalid, None))  # type: ignore
+            args = (self.file_path, self.ignore_invalid, None, self.unchecked)
         else:
-            return (self.__class__, (None, self.ignore_invalid, list(self.ips)))  # type: ignore
+            args = (None, self.ignore_invalid, list(self.ips), self.unchecked)
+        return (self.__class__, args)  # type: ignore
 
     def __len__(self):
         return len(self.ips)
@@ -1,22 +1,29 @@
 import os
+import pickle
+import shutil
 import sys
+import tempfile
+import time
 import unittest
+from ipaddress import IPv4Address
 from pathlib import Path
+from unittest import mock
 
 # Add the parent directory to the sys.path to allow imports from the main project
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from ip_list import IPList
+from ip_list import _READ_CACHE, IPList, clear_read_cache, set_read_cache_size
 
 
 class TestIPList(unittest.TestCase):
-    def setUp(self):
-        """Set up test files."""
-        self.test_dir = Path("test_data")
-        self.test_dir.mkdir(exist_ok=True)
-
-        self.valid_ips_file = self.test_dir / "valid_ips.txt"
-        with open(self.valid_ips_file, "w") as f:
+    @classmethod
+    def setUpClass(cls):
+        """Set up test files shared by every test."""
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.test_dir = Path(cls._tmp.name)
+
+        cls.valid_ips_file = cls.test_dir / "valid_ips.txt"
+        with open(cls.valid_ips_file, "w") as f:
             f.write("192.168.1.1\n")
             f.write("10.0.0.1\n")
             f.write("# This is a comment\n")
@@ -25,24 +32,33 @@ class TestIPList(unittest.TestCase):
                 "2001:0db8:85a3:0000:0000:8a2e:0370:7334\n"
             )  # Valid IPv6, but IPv6 is unsupported so treated as invalid
 
-        self.invalid_ips_file = self.test_dir / "invalid_ips.txt"
-        with open(self.invalid_ips_file, "w") as f:
+        cls.invalid_ips_file = cls.test_dir / "invalid_ips.txt"
+        with open(cls.invalid_ips_file, "w") as f:
             f.write("192.168.1.1\n")
             f.write("not-an-ip\n")
             f.write("10.0.0.2\n")
 
-        self.empty_file = self.test_dir / "empty.txt"
-        self.empty_file.touch()
+        cls.empty_file = cls.test_dir / "empty.txt"
+        cls.empty_file.touch()
 
-        self.ipv6_file = self.test_dir / "ipv6.txt"
-        with open(self.ipv6_file, "w") as f:
+        cls.ipv6_file = cls.test_dir / "ipv6.txt"
+        with open(cls.ipv6_file, "w") as f:
             f.write("2001:0db8:85a3:0000:0000:8a2e:0370:7334\n")
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test files."""
-        for f in self.test_dir.iterdir():
-            f.unlink()
-        self.test_dir.rmdir()
+        cls._tmp.cleanup()
+
+    def _scratch_dir(self) -> Path:
+        """Creates a directory for this test only, removed after it runs."""
+        scratch = Path(tempfile.mkdtemp(dir=self.test_dir))
+        self.addCleanup(shutil.rmtree, scratch)
+        return scratch
+
+    def _scratch_copy(self, path: Path) -> Path:
+        """Copies a shared fixture so the test can modify it."""
+        return Path(shutil.copy(path, self._scratch_dir()))
 
     def test_read_valid_ips(self):
         """Test reading a file with valid IP addresses."""
@@ -70,18 +86,160 @@ class TestIPList(unittest.TestCase):
         self.assertIn("10.0.0.2", ip_list)
         self.assertNotIn("not-an-ip", ip_list)
 
+    def test_read_comments_and_line_endings(self):
+        """Test comment and whitespace handling across line-ending styles."""
+        path = self._scratch_dir() / "mixed.txt"
+        path.write_bytes(
+            b"# header\r\n192.168.1.1 # web\r\n\t10.0.0.1\t\r8.8.8.8#dns\n\n  #\n"
+        )
+        ip_list = IPList(path)
+        self.assertEqual(ip_list.ips, {"192.168.1.1", "10.0.0.1", "8.8.8.8"})
+
+    def test_read_splits_only_on_newlines(self):
+        """Test that other line-break characters do not split entries."""
+        path = self._scratch_dir() / "separators.txt"
+        for sep in ("\x0b", "\x0c", "\x1c", "\x85", "\u2028"):
+            path.write_text(f"1.2.3.4{sep}5.6.7.8\n", encoding="utf-8")
+            with self.subTest(sep=sep), self.assertRaisesRegex(
+                ValueError, "Invalid IP address found"
+            ):
+                IPList.from_bytes(path.read_bytes(), encoding="utf-8")
+        path.write_text("1.2.3.4\x0c5.6.7.8\n")
+        with self.assertRaisesRegex(ValueError, "Invalid IP address found"):
+            IPList(path)
+
     def test_reload(self):
         """Test reloading the IP list from the file."""
-        ip_list = IPList(self.valid_ips_file, ignore_invalid=True)
+        path = self._scratch_copy(self.valid_ips_file)
+        ip_list = IPList(path, ignore_invalid=True)
         self.assertEqual(len(ip_list), 2)
 
-        with open(self.valid_ips_file, "a") as f:
+        with open(path, "a") as f:
             f.write("8.8.8.8\n")
 
         ip_list.reload()
         self.assertEqual(len(ip_list), 3)
         self.assertIn("8.8.8.8", ip_list)
 
+    def test_reload_unchanged_file_skips_parsing(self):
+        """Test that reloading an unchanged file reuses the previous parse."""
+        path = self._scratch_copy(self.valid_ips_file)
+        ip_list = IPList(path, ignore_invalid=True)
+        ip_list.ips.add("8.8.8.8")
+
+        with mock.patch.object(IPList, "_parse", wraps=ip_list._parse) as parse:
+            ip_list.reload()
+            parse.assert_not_called()
+        # Reload still discards changes made to the set since the last read
+        self.assertEqual(ip_list.ips, {"192.168.1.1", "10.0.0.1"})
+
+        with open(path, "a") as f:
+            f.write("8.8.4.4\n")
+        ip_list.reload()
+        self.assertIn("8.8.4.4", ip_list)
+
+    def test_reload_appended_file_parses_only_tail(self):
+        """Test that reloading an appended-to file only parses the new lines."""
+        path = self._scratch_copy(self.valid_ips_file)
+        ip_list = IPList(path, ignore_invalid=True)
+        with open(path, "a") as f:
+            f.write("8.8.8.8 # dns\n")
+
+        with mock.patch.object(IPList, "_parse", wraps=ip_list._parse) as parse:
+            ip_list.reload()
+            parse.assert_called_once_with(["8.8.8.8"])
+        self.assertEqual(ip_list.ips, {"192.168.1.1", "10.0.0.1", "8.8.8.8"})
+
+    def test_reload_rewritten_file_parses_everything(self):
+        """Test that reloading picks up in-place edits, even at the same size."""
+        path = self._scratch_copy(self.invalid_ips_file)
+        ip_list = IPList(path, ignore_invalid=True)
+        path.write_text("192.168.1.9\nnot-an-ip\n10.0.0.2\n")
+        ip_list.reload()
+        self.assertEqual(ip_list.ips, {"192.168.1.9", "10.0.0.2"})
+
+        # Grown, but the old contents are no longer a prefix
+        path.write_text("1.1.1.1\nnot-an-ip\n10.0.0.2\n8.8.8.8\n")
+        ip_list.reload()
+        self.assertEqual(ip_list.ips, {"1.1.1.1", "10.0.0.2", "8.8.8.8"})
+
+    def test_read_rewritten_file_with_preserved_mtime(self):
+        """Test that reads see a same-size rewrite whose mtime was restored."""
+        path = self._scratch_copy(self.invalid_ips_file)
+        path.write_text("10.0.0.1\n")
+        old = time.time() - 3600
+        os.utime(path, (old, old))
+        ip_list = IPList(path)
+
+        path.write_text("10.0.0.2\n")
+        os.utime(path, (old, old))
+        self.assertEqual(IPList(path).ips, {"10.0.0.2"})
+        ip_list.reload()
+        self.assertEqual(ip_list.ips, {"10.0.0.2"})
+
+    def test_reload_appended_to_unterminated_line(self):
+        """Test that appending to a file without a final newline re-parses it."""
+        path = self._scratch_dir() / "unterminated.txt"
+        path.write_text("10.0.0.1")
+        ip_list = IPList(path)
+        with open(path, "a") as f:
+            f.write("0\n")
+        ip_list.reload()
+        self.assertEqual(ip_list.ips, {"10.0.0.10"})
+
+    def test_same_file_parsed_once_across_instances(self):
+        """Test that a second IPList on an unchanged file reuses the parse."""
+        path = self._scratch_copy(self.invalid_ips_file)
+        ip_list1 = IPList(path, ignore_invalid=True)
+
+        with mock.patch.object(IPList, "_parse") as parse:
+            ip_list2 = IPList(path, ignore_invalid=True)
+            parse.assert_not_called()
+        self.assertEqual(ip_list1, ip_list2)
+        self.assertIsNot(ip_list1.ips, ip_list2.ips)
+
+        # Different parse settings are cached separately
+        with self.assertRaises(ValueError):
+            IPList(path)
+
+    def test_read_cache_keeps_one_entry_per_file(self):
+        """Test that re-reading an updated file replaces its cached parse."""
+        path = self._scratch_copy(self.valid_ips_file)
+        for i in range(3):
+            with open(path, "a") as f:
+                f.write(f"8.8.8.{i}\n")
+            IPList(path, ignore_invalid=True)
+
+        resolved = path.resolve()
+        self.assertEqual(
+            [key for key in _READ_CACHE if key[0] == resolved],
+            [(resolved, True, False)],
+        )
+        self.assertEqual(len(_READ_CACHE[resolved, True, False].ips), 5)
+
+    def test_read_cache_clear_and_size(self):
+        """Test clearing, shrinking and disabling the shared read cache."""
+        self.addCleanup(set_read_cache_size, 16)
+        path = self._scratch_copy(self.valid_ips_file)
+        IPList(path, ignore_invalid=True)
+        self.assertTrue(_READ_CACHE)
+        clear_read_cache()
+        self.assertFalse(_READ_CACHE)
+
+        IPList(self.valid_ips_file, ignore_invalid=True)
+        IPList(self.invalid_ips_file, ignore_invalid=True)
+        set_read_cache_size(1)
+        self.assertEqual(
+            list(_READ_CACHE), [(self.invalid_ips_file.resolve(), True, False)]
+        )
+
+        set_read_cache_size(0)
+        ip_list = IPList(path, ignore_invalid=True)
+        self.assertFalse(_READ_CACHE)
+        self.assertEqual(len(ip_list), 2)
+        with self.assertRaises(ValueError):
+            set_read_cache_size(-1)
+
     def test_equality(self):
         """Test the equality comparison of two IPList objects."""
         ip_list1 = IPList(self.valid_ips_file, ignore_invalid=True)
@@ -91,6 +249,17 @@ class TestIPList(unittest.TestCase):
         ip_list3 = IPList(self.invalid_ips_file, ignore_invalid=True)
         self.assertNotEqual(ip_list1, ip_list3)
         self.assertNotEqual(ip_list1, "not an IPList")
+        self.assertIs(ip_list1.__eq__("not an IPList"), NotImplemented)
+
+    def test_equality_after_mutation(self):
+        """Test that IPLists read from the same file differ once one is changed."""
+        ip_list1 = IPList(self.valid_ips_file, ignore_invalid=True)
+        ip_list2 = IPList(self.valid_ips_file, ignore_invalid=True)
+        ip_list2.ips.discard("10.0.0.1")
+        self.assertNotEqual(ip_list1, ip_list2)
+
+        ip_list2.ips.add("8.8.8.8")
+        self.assertNotEqual(ip_list1, ip_list2)
 
     def test_contains(self):
         """Test the 'in' operator."""
@@ -98,6 +267,59 @@ class TestIPList(unittest.TestCase):
         self.assertIn("192.168.1.1", ip_list)
         self.assertNotIn("1.1.1.1", ip_list)
 
+    def test_contains_non_string_keys(self):
+        """Test the 'in' operator with IPv4Address and integer keys."""
+        ip_list = IPList(self.valid_ips_file, ignore_invalid=True)
+        self.assertIn(IPv4Address("192.168.1.1"), ip_list)
+        self.assertNotIn(IPv4Address("1.1.1.1"), ip_list)
+        self.assertIn(0x0A000001, ip_list)  # 10.0.0.1
+        self.assertNotIn(0x01010101, ip_list)
+        self.assertNotIn(-1, ip_list)
+        self.assertNotIn(2**32, ip_list)
+        self.assertNotIn(True, ip_list)
+        self.assertNotIn(None, ip_list)
+
+    def test_contains_many(self):
+        """Test bulk membership checks."""
+        ip_list = IPList(self.valid_ips_file, ignore_invalid=True)
+        self.assertEqual(
+            ip_list.contains_many(["192.168.1.1", "1.1.1.1", "10.0.0.1"]),
+            [True, False, True],
+        )
+        self.assertEqual(ip_list.contains_many([]), [])
+
+    def test_bulk_contains_matches_in(self):
+        """Test that the bulk checks treat every query like the 'in' operator."""
+        ip_list = IPList(self.valid_ips_file, ignore_invalid=True)
+        queries = [
+            "10.0.0.1",
+            IPv4Address("192.168.1.1"),
+            0x0A000001,
+            IPv4Address("1.1.1.1"),
+            2**32,
+            True,
+            None,
+            ["10.0.0.1"],
+        ]
+        expected = [query in ip_list for query in queries]
+        self.assertEqual(expected, [True, True, True] + [False] * 5)
+        self.assertEqual(ip_list.contains_many(queries), expected)
+        self.assertEqual(ip_list.contains_many(iter(queries)), expected)
+        self.assertTrue(ip_list.contains_all([IPv4Address("10.0.0.1"), 0xC0A80101]))
+        self.assertFalse(ip_list.contains_all(["10.0.0.1", ["10.0.0.1"]]))
+        self.assertTrue(ip_list.contains_any([{"x"}, IPv4Address("10.0.0.1")]))
+        self.assertFalse(ip_list.contains_any([["10.0.0.1"], 2**32]))
+
+    def test_contains_all_and_any(self):
+        """Test bulk all/any membership checks."""
+        ip_list = IPList(self.valid_ips_file, ignore_invalid=True)
+        self.assertTrue(ip_list.contains_all(["192.168.1.1", "10.0.0.1"]))
+        self.assertFalse(ip_list.contains_all(["192.168.1.1", "1.1.1.1"]))
+        self.assertTrue(ip_list.contains_all([]))
+        self.assertTrue(ip_list.contains_any(iter(["1.1.1.1", "10.0.0.1"])))
+        self.assertFalse(ip_list.contains_any(["1.1.1.1", "8.8.8.8"]))
+        self.assertFalse(ip_list.contains_any([]))
+
     def test_repr(self):
         """Test the __repr__ method."""
         ip_list = IPList(self.valid_ips_file, ignore_invalid=True)
@@ -141,6 +363,15 @@ class TestIPList(unittest.TestCase):
         self.assertIn("192.168.1.1", ip_list)
         self.assertIn("10.0.0.1", ip_list)
 
+    def test_init_with_list_invalid_ips_ignore_logs(self):
+        """Test that ignored entries are logged at DEBUG level."""
+        ips = ["192.168.1.1", "not-an-ip", "2001:db8::1"]
+        with self.assertLogs(level="DEBUG") as logs:
+            IPList(ips=ips, ignore_invalid=True)
+        output = "\n".join(logs.output)
+        self.assertIn("Ignoring invalid IP address: not-an-ip", output)
+        self.assertIn("Ignoring IPv6 address: 2001:db8::1", output)
+
     def test_init_with_list_ipv6_raise(self):
         """Test initializing with IPv6 and ignore_invalid=False."""
         ips = ["192.168.1.1", "2001:0db8:85a3:0000:0000:8a2e:0370:7334"]
@@ -155,6 +386,24 @@ class TestIPList(unittest.TestCase):
         self.assertIn("192.168.1.1", ip_list)
         self.assertIn("10.0.0.1", ip_list)
 
+    def test_init_with_list_non_canonical_ipv4_raise(self):
+        """Test that shorthand, octal and hex IPv4 forms are rejected."""
+        for ip in ["10.1", "1.2.3", "010.0.0.1", "0x7f.0.0.1", "1.2.3.4 x"]:
+            with self.subTest(ip=ip):
+                with self.assertRaisesRegex(ValueError, "Invalid IP address found"):
+                    IPList(ips=[ip])
+
+    def test_init_with_list_overlong_line_ignore(self):
+        """Test that lines longer than any IPv4 address are treated as invalid."""
+        ips = ["192.168.1.1", "192.168.100.100.1", "x" * 100]
+        ip_list = IPList(ips=ips, ignore_invalid=True)
+        self.assertEqual(ip_list.ips, {"192.168.1.1"})
+
+    def test_init_with_list_colon_garbage_is_invalid(self):
+        """Test that a non-IPv6 string containing ':' is reported as invalid."""
+        with self.assertRaisesRegex(ValueError, "Invalid IP address found"):
+            IPList(ips=["not:an:ip"])
+
     def test_init_with_list_comments_and_whitespace(self):
         """Test initializing with list containing comments and whitespace."""
         ips = ["192.168.1.1", "  10.0.0.1  ", "# comment", "", "8.8.8.8"]
@@ -164,6 +413,25 @@ class TestIPList(unittest.TestCase):
         self.assertIn("10.0.0.1", ip_list)
         self.assertIn("8.8.8.8", ip_list)
 
+    def test_init_unchecked_skips_validation(self):
+        """Test that unchecked=True stores cleaned entries without validation."""
+        ips = ["192.168.1.1  # web", "", "not-an-ip", "2001:db8::1"]
+        ip_list = IPList(ips=ips, unchecked=True)
+        self.assertEqual(ip_list.ips, {"192.168.1.1", "not-an-ip", "2001:db8::1"})
+
+    def test_unchecked_roundtrip_through_tempfile(self):
+        """Test loading a file written by write_to_tempfile with unchecked=True."""
+        ip_list = IPList(self.valid_ips_file, ignore_invalid=True)
+        with ip_list.to_tempfile() as temp_path:
+            self.assertEqual(IPList(temp_path, unchecked=True), ip_list)
+
+    def test_pickle_preserves_unchecked(self):
+        """Test that pickling round-trips the unchecked flag."""
+        ip_list = IPList(ips=["not-an-ip"], unchecked=True)
+        restored = pickle.loads(pickle.dumps(ip_list))
+        self.assertTrue(restored.unchecked)
+        self.assertEqual(restored.ips, {"not-an-ip"})
+
     def test_init_no_args_raises(self):
         """Test that initializing without file_path or ips raises ValueError."""
         with self.assertRaisesRegex(
@@ -187,13 +455,49 @@ class TestIPList(unittest.TestCase):
 
         try:
             self.assertTrue(temp_file.exists())
-            with open(temp_file, "r") as f:
-                content = f.read().strip().split("\n")
+            content = [
+                b.decode("ascii") for b in temp_file.read_bytes().splitlines() if b
+            ]
             # Should be sorted
             self.assertEqual(content, ["10.0.0.1", "192.168.1.1", "8.8.8.8"])
         finally:
             temp_file.unlink(missing_ok=True)
 
+    def test_write_to_tempfile_empty(self):
+        """Test that an empty IP list writes an empty temporary file."""
+        ip_list = IPList(self.empty_file)
+        temp_file = ip_list.write_to_tempfile()
+
+        try:
+            self.assertEqual(temp_file.read_text(), "")
+        finally:
+            temp_file.unlink(missing_ok=True)
+
+    def test_write_to_tempfile_after_mutation(self):
+        """Test that repeated tempfile writes reflect mutations of the set."""
+        ip_list = IPList(ips=["192.168.1.1", "10.0.0.1"])
+        with ip_list.to_tempfile() as temp_path:
+            self.assertEqual(temp_path.read_text().split(), ["10.0.0.1", "192.168.1.1"])
+
+        ip_list.set.add("8.8.8.8")
+        ip_list.set.discard("10.0.0.1")
+        with ip_list.to_tempfile() as temp_path:
+            self.assertEqual(temp_path.read_text().split(), ["192.168.1.1", "8.8.8.8"])
+
+    def test_sorted_cache_kept_only_for_repeated_writes(self):
+        """Test that a single write does not keep a sorted copy of the IPs."""
+        ip_list = IPList(ips=["192.168.1.1", "10.0.0.1"])
+        with ip_list.to_tempfile():
+            pass
+        self.assertIsNone(ip_list._sorted_cache)
+
+        with ip_list.to_tempfile() as temp_path:
+            self.assertEqual(temp_path.read_text().split(), ["10.0.0.1", "192.168.1.1"])
+        self.assertIsNotNone(ip_list._sorted_cache)
+        with mock.patch(f"{IPList.__module__}.sorted", create=True) as sort:
+            ip_list.write_to_tempfile().unlink()
+            sort.assert_not_called()
+
     def test_to_tempfile_context_manager(self):
         """Test the to_tempfile context manager."""
         ips = ["192.168.1.1", "10.0.0.1"]
@@ -201,8 +505,9 @@ class TestIPList(unittest.TestCase):
 
         with ip_list.to_tempfile() as temp_path:
             self.assertTrue(temp_path.exists())
-            with open(temp_path, "r") as f:
-                content = f.read().strip().split("\n")
+            content = [
+                b.decode("ascii") for b in temp_path.read_bytes().splitlines() if b
+            ]
             self.assertEqual(sorted(content), ["10.0.0.1", "192.168.1.1"])
             temp_file_saved = temp_path
 
@@ -249,6 +554,38 @@ class TestIPList(unittest.TestCase):
             temp_ip_list = IPList(temp_path)
             self.assertEqual(ip_list.ips, temp_ip_list.ips)
 
+    def test_from_bytes(self):
+        """Test building an IPList from in-memory file contents."""
+        data = self.invalid_ips_file.read_bytes()
+        ip_list = IPList.from_bytes(data, ignore_invalid=True)
+        self.assertIsNone(ip_list.file_path)
+        self.assertEqual(ip_list, IPList(self.invalid_ips_file, ignore_invalid=True))
+
+        with self.assertRaisesRegex(ValueError, "Invalid IP address found: not-an-ip"):
+            IPList.from_bytes(data)
+
+        with self.assertLogs(level="INFO") as logs:
+            ip_list = IPList.from_bytes(
+                b"# header\r\n10.0.0.1 # web\r\n", unchecked=True
+            )
+        self.assertEqual(logs.output, ["INFO:root:Loaded 1 IPs from bytes"])
+        self.assertEqual(ip_list.ips, {"10.0.0.1"})
+        self.assertEqual(pickle.loads(pickle.dumps(ip_list)), ip_list)
+        self.assertEqual(
+            repr(ip_list), "IPList(from_bytes=True, ignore_invalid=False, ip_count=1)"
+        )
+        self.assertEqual(str(ip_list), "IPList with 1 IPs from bytes")
+
+        class Tagged(IPList):
+            def _init_attributes(self, *args, **kwargs):
+                super()._init_attributes(*args, **kwargs)
+                self.tag = "blocklist"
+
+        tagged = Tagged.from_bytes(b"10.0.0.1\n")
+        self.assertIsInstance(tagged, Tagged)
+        self.assertEqual(tagged.tag, "blocklist")
+        self.assertIsNone(tagged._sorted_cache)
+
     def test_file_property_alias(self):
         """Test that the 'file' property is an alias for 'file_path'."""
         ip_list = IPList(self.valid_ips_file, ignore_invalid=True)
@@ -331,7 +668,7 @@ class TestIPList(unittest.TestCase):
         self.assertIsNotNone(quoted_path)
         self.assertIsInstance(quoted_path, str)
         # The path should be quoted (safe for shell use)
-        # Since test_data/valid_ips.txt doesn't have special characters,
+        # Since valid_ips.txt doesn't have special characters,
         # it might not have quotes, but it should contain the filename
         self.assertIn("valid_ips.txt", quoted_path)
 